@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from app.core.config import settings
@@ -51,3 +51,20 @@ async def get_current_user_optional(token: str = Depends(oauth2_scheme), db = De
         return user
     except:
         return None
+
+def get_rate_limit_key(request: Request) -> str:
+    """Identify the caller for rate limiting without touching the database.
+
+    A valid bearer token keys the bucket by its subject (the user's email);
+    anything else falls back to the client IP.
+    """
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except JWTError:
+            pass
+    return f"ip:{request.client.host if request.client else 'unknown'}"
@@ -30,10 +30,15 @@ MOCK_JOBS = [
 async def match_jobs(resume_text: str = Body(..., embed=True)):
     results = []
     resume_clean = ai_service.clean_text(resume_text)
+    job_descs_clean = [ai_service.clean_text(job["description"]) for job in MOCK_JOBS]
+    # Extract experience once for the resume and every job instead of once per pair,
+    # from the raw text where headings and ranges survive
+    resume_exp, *job_exps = ai_service.extract_experience_years_batch(
+        [resume_text] + [job["description"] for job in MOCK_JOBS]
+    )
     
-    for job in MOCK_JOBS:
-        job_desc_clean = ai_service.clean_text(job["description"])
-        analysis = ai_service.analyze_resume(resume_clean, job_desc_clean)
+    for job, job_desc_clean, job_exp in zip(MOCK_JOBS, job_descs_clean, job_exps):
+        analysis = ai_service.analyze_resume(resume_clean, job_desc_clean, resume_exp=resume_exp, job_exp=job_exp)
         
         results.append({
             "id": job["id"],
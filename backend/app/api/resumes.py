@@ -1,6 +1,7 @@
 from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
 from app.services.ai_service import ai_service
 from app.services.database import get_database
+from app.services.history_writer import history_writer
 from app.api.deps import get_current_user, get_current_user_optional
 import os
 import shutil
@@ -18,7 +19,6 @@ if not os.path.exists(UPLOAD_DIR):
 async def analyze_resume(
     file: UploadFile = File(...),
     job_description: str = Form(...),
-    db = Depends(get_database),
     current_user: Optional[dict] = Depends(get_current_user_optional)
 ):
     # Save file temporarily
@@ -42,8 +42,13 @@ async def analyze_resume(
         resume_text_clean = ai_service.clean_text(resume_text)
         job_desc_clean = ai_service.clean_text(job_description)
         
+        # Experience is read from the raw text, where headings and ranges survive
+        resume_exp, job_exp = ai_service.extract_experience_years_batch([resume_text, job_description])
+        
         # Analyze
-        analysis_result = await ai_service.analyze_resume_llm(resume_text_clean, job_desc_clean)
+        analysis_result = await ai_service.analyze_resume_llm(
+            resume_text_clean, job_desc_clean, resume_exp=resume_exp, job_exp=job_exp
+        )
         
         # Save to database if user is logged in
         if current_user:
@@ -54,7 +59,7 @@ async def analyze_resume(
                 "result": analysis_result,
                 "created_at": datetime.utcnow()
             }
-            await db.analysis_history.insert_one(analysis_record)
+            await history_writer.add(analysis_record)
         
         return analysis_result
     
@@ -14,6 +14,22 @@ class Settings(BaseSettings):
     
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "resume_analyzer")
+
+    # MongoDB connection pool
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+
+    # Background health monitor
+    HEALTH_CHECK_INTERVAL_SECONDS: float = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "10"))
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "2"))
+
+    # Analysis history write-behind buffer
+    HISTORY_BATCH_SIZE: int = int(os.getenv("HISTORY_BATCH_SIZE", "100"))
+    HISTORY_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("HISTORY_FLUSH_INTERVAL_SECONDS", "1.0"))
+    HISTORY_MAX_BUFFER: int = int(os.getenv("HISTORY_MAX_BUFFER", "5000"))
+    HISTORY_SYNC_WRITES: bool = os.getenv("HISTORY_SYNC_WRITES", "false").lower() == "true"
     
     ALLOWED_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -25,6 +41,16 @@ class Settings(BaseSettings):
     ]
 
     
+    # Rate limiting (token bucket per user or client IP)
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    # "memory" for a single worker, "redis" to share buckets across workers
+    RATE_LIMIT_STORAGE: str = os.getenv("RATE_LIMIT_STORAGE", "memory")
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_LLM_CAPACITY: int = int(os.getenv("RATE_LIMIT_LLM_CAPACITY", "5"))
+    RATE_LIMIT_LLM_PER_MINUTE: float = float(os.getenv("RATE_LIMIT_LLM_PER_MINUTE", "5"))
+    RATE_LIMIT_ANALYSIS_CAPACITY: int = int(os.getenv("RATE_LIMIT_ANALYSIS_CAPACITY", "20"))
+    RATE_LIMIT_ANALYSIS_PER_MINUTE: float = float(os.getenv("RATE_LIMIT_ANALYSIS_PER_MINUTE", "30"))
+
     # AI Config
     SPACY_MODEL: str = "en_core_web_sm"
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
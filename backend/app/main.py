@@ -1,17 +1,30 @@
-from fastapi import FastAPI, Depends, Request
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.api import auth, resumes, jobs, users
+from app.api.deps import get_rate_limit_key
 from app.core.config import settings
 import time
 
 from contextlib import asynccontextmanager
-from app.services.database import connect_to_mongo, close_mongo_connection, get_database
+from app.services.database import connect_to_mongo, close_mongo_connection
+from app.services.history_writer import history_writer
+from app.services.health import health_monitor
+from app.services.rate_limiter import rate_limiter
+from app.services.ai_service import ai_service
+import math
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await connect_to_mongo()
+    await history_writer.start()
+    await health_monitor.start()
     yield
+    await health_monitor.stop()
+    # Flush buffered history before the client goes away
+    await history_writer.stop()
+    await rate_limiter.close()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -30,6 +43,27 @@ async def add_process_time_header(request: Request, call_next):
     print(f"Request finished: {request.method} {request.url} - Status: {response.status_code} - Time: {process_time:.4f}s")
     return response
 
+# Expensive endpoints and the budget they draw from. Analysis goes through the
+# LLM when an API key is configured, so the scope is resolved per request.
+RATE_LIMITED_ROUTES = {
+    ("POST", "/api/resumes/analyze"): lambda: "llm" if ai_service.llm_enabled() else "analysis",
+    ("POST", "/api/jobs/match"): lambda: "analysis",
+}
+
+# Runs as middleware so rejected requests never have their body read or parsed
+@app.middleware("http")
+async def enforce_rate_limit(request: Request, call_next):
+    scope = RATE_LIMITED_ROUTES.get((request.method, request.url.path.rstrip("/")))
+    if scope is not None:
+        retry_after = await rate_limiter.check(scope(), get_rate_limit_key(request))
+        if retry_after > 0:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests. Please try again later."},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+    return await call_next(request)
+
 # Set up CORS
 origins = settings.ALLOWED_ORIGINS
 
@@ -39,6 +73,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
 # Include routers
@@ -47,31 +82,29 @@ app.include_router(resumes.router, prefix="/api/resumes", tags=["Resumes"])
 app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
 
+# Health probes are served from the background monitor's cached result,
+# so they never hit MongoDB directly
 @app.get("/api/health")
-async def health_check(db = Depends(get_database)):
-    try:
-        if db is None:
-            return {"status": "unhealthy", "database": "disconnected", "error": "Database object is None"}
-        # Ping with short timeout
-        import asyncio
-        await asyncio.wait_for(db.command('ping'), timeout=2.0)
+async def health_check():
+    snapshot = health_monitor.snapshot()
+    if health_monitor.is_ready():
         return {
             "status": "healthy",
-            "database": "connected",
-            "message": "Connected to MongoDB Atlas"
-        }
-    except asyncio.TimeoutError:
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": "MongoDB connection timed out (2s)"
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
+            "message": "Connected to MongoDB Atlas",
+            **snapshot
         }
+    return {"status": "unhealthy", **snapshot}
+
+@app.get("/api/health/live")
+async def liveness_check():
+    return {"status": "alive"}
+
+@app.get("/api/health/ready")
+async def readiness_check():
+    snapshot = health_monitor.snapshot()
+    if health_monitor.is_ready():
+        return {"status": "ready", **snapshot}
+    return JSONResponse(status_code=503, content={"status": "not_ready", **snapshot})
 
 @app.get("/")
 async def root():
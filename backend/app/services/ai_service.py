@@ -8,6 +8,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 from app.core.config import settings
+from app.utils.experience import extract_experience_years, extract_experience_years_batch
 from openai import AsyncOpenAI
 
 class AIService:
@@ -39,10 +40,13 @@ class AIService:
         text = re.sub(r'\s+', ' ', text).strip().lower()
         return text
 
-    async def analyze_resume_llm(self, resume_text, job_desc_text):
-        if not os.getenv("OPENAI_API_KEY"):
+    def llm_enabled(self):
+        return bool(os.getenv("OPENAI_API_KEY"))
+
+    async def analyze_resume_llm(self, resume_text, job_desc_text, resume_exp=None, job_exp=None):
+        if not self.llm_enabled():
             # Fallback to local analysis if no API key
-            return self.analyze_resume(resume_text, job_desc_text)
+            return self.analyze_resume(resume_text, job_desc_text, resume_exp=resume_exp, job_exp=job_exp)
 
         prompt = f"""
         Act as an expert technical recruiter and ATS systems analyst. 
@@ -74,33 +78,15 @@ class AIService:
             return json.loads(response.choices[0].message.content)
         except Exception as e:
             print(f"LLM Error: {e}")
-            return self.analyze_resume(resume_text, job_desc_text)
+            return self.analyze_resume(resume_text, job_desc_text, resume_exp=resume_exp, job_exp=job_exp)
 
-    def extract_experience_years(self, text):
-        # Improved regex to capture more formats like "5+ years", "5 years", "five years", "10+ yrs"
-        text_lower = text.lower()
-        # Convert word numbers to digits for common small numbers
-        word_map = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
-        for word, digit in word_map.items():
-            text_lower = text_lower.replace(f"{word} year", f"{digit} year")
-
-        patterns = [
-            r'(\d+)\s*\+?\s*years?',
-            r'(\d+)\s*\+?\s*yrs?',
-            r'(\d+)\s*\+?\s*yoe'
-        ]
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                try:
-                    val = int(match)
-                    if 0 < val < 40: # Sanity check for realistic experience
-                        years.append(val)
-                except:
-                    pass
-        
-        return max(years) if years else 0
+    def extract_experience_years(self, text, cleaned=False):
+        # Single compiled scan over explicit claims and work-history date ranges.
+        # Raw text (before clean_text) keeps headings and number ranges intact.
+        return extract_experience_years(text, cleaned=cleaned)
+
+    def extract_experience_years_batch(self, texts, cleaned=False):
+        return extract_experience_years_batch(texts, cleaned=cleaned)
 
     def extract_skills(self, text):
         # Professional-grade skill database
@@ -164,14 +150,16 @@ class AIService:
             union = len(set1.union(set2))
             return intersection / union if union > 0 else 0.0
 
-    def analyze_resume(self, resume_text, job_desc_text):
+    def analyze_resume(self, resume_text, job_desc_text, resume_exp=None, job_exp=None):
         # 1. Skill Analysis
         resume_skills_dict = self.extract_skills(resume_text)
         job_skills_dict = self.extract_skills(job_desc_text)
         
-        # 2. Experience Analysis
-        resume_exp = self.extract_experience_years(resume_text)
-        job_exp = self.extract_experience_years(job_desc_text)
+        # 2. Experience Analysis (callers should pass values extracted from the raw text)
+        if resume_exp is None:
+            resume_exp = self.extract_experience_years(resume_text, cleaned=True)
+        if job_exp is None:
+            job_exp = self.extract_experience_years(job_desc_text, cleaned=True)
         if job_exp == 0: job_exp = 3 # Default to 3 years if not found in JD
         
         # 3. Calculate Scores
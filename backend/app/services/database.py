@@ -1,11 +1,101 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from app.core.config import settings
+from typing import Dict
 import logging
+import threading
 import certifi
 
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Tracks connection pool usage per server from pymongo's CMAP events.
+
+    Each replica set member has its own pool bounded by maxPoolSize, so counters
+    are kept per `event.address`. Events are published from driver threads, so
+    counters are guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, Dict[str, int]] = {}
+
+    def _pool(self, event) -> Dict[str, int]:
+        host, port = event.address
+        key = f"{host}:{port}"
+        if key not in self._pools:
+            self._pools[key] = {"open_connections": 0, "checked_out": 0, "waiting": 0, "wait_queue_timeouts": 0}
+        return self._pools[key]
+
+    def _adjust(self, event, counter: str, delta: int):
+        with self._lock:
+            pool = self._pool(event)
+            pool[counter] = max(0, pool[counter] + delta)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self._lock:
+            host, port = event.address
+            self._pools.pop(f"{host}:{port}", None)
+
+    def connection_created(self, event):
+        self._adjust(event, "open_connections", 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._adjust(event, "open_connections", -1)
+
+    def connection_check_out_started(self, event):
+        self._adjust(event, "waiting", 1)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            pool = self._pool(event)
+            pool["waiting"] = max(0, pool["waiting"] - 1)
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                pool["wait_queue_timeouts"] += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            pool = self._pool(event)
+            pool["waiting"] = max(0, pool["waiting"] - 1)
+            pool["checked_out"] += 1
+
+    def connection_checked_in(self, event):
+        self._adjust(event, "checked_out", -1)
+
+    def stats(self) -> dict:
+        max_size = settings.MONGODB_MAX_POOL_SIZE
+        with self._lock:
+            servers = {}
+            for address, pool in self._pools.items():
+                servers[address] = {
+                    **pool,
+                    # maxPoolSize=0 means unbounded, so utilization is not meaningful
+                    "utilization": round(pool["checked_out"] / max_size, 3) if max_size > 0 else None,
+                }
+        utilizations = [server["utilization"] for server in servers.values() if server["utilization"] is not None]
+        return {
+            "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+            "max_pool_size": max_size,
+            # The busiest server's pool is the one that runs out first
+            "utilization": max(utilizations) if utilizations else None,
+            "wait_queue_timeouts": sum(server["wait_queue_timeouts"] for server in servers.values()),
+            "servers": servers,
+        }
+
 class Database:
     client: AsyncIOMotorClient = None
     db = None
+    pool_monitor: PoolMonitor = PoolMonitor()
 
 db = Database()
 
@@ -14,7 +104,12 @@ async def connect_to_mongo():
         db.client = AsyncIOMotorClient(
             settings.MONGODB_URL,
             serverSelectionTimeoutMS=5000, # 5 second timeout
-            tlsCAFile=certifi.where()
+            tlsCAFile=certifi.where(),
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            event_listeners=[db.pool_monitor]
         )
         db.db = db.client[settings.DATABASE_NAME]
         # Verify connection
@@ -22,12 +117,14 @@ async def connect_to_mongo():
         logging.info("Successfully connected to MongoDB")
     except Exception as e:
         logging.error(f"Could not connect to MongoDB: {e}")
-        # We don't raise here to allow the app to start, 
-        # but operations will fail with clear timeout errors
+        # We don't raise here to allow the app to start; the health monitor
+        # calls connect_to_mongo again while db.client is None (e.g. SRV/DNS
+        # failures) and /api/health/ready reports not ready until it succeeds
         pass
 
 async def close_mongo_connection():
-    db.client.close()
+    if db.client is not None:
+        db.client.close()
     logging.info("Closed MongoDB connection")
 
 async def get_database():
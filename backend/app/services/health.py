@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from app.core.config import settings
+from app.services.database import db, connect_to_mongo
+
+class HealthMonitor:
+    """Pings MongoDB in the background and caches the result for health probes."""
+
+    def __init__(self, interval: float, timeout: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.connected = False
+        self.error: Optional[str] = "Health check has not run yet"
+        self.latency_ms: Optional[float] = None
+        # Wall-clock time is only reported; staleness uses the monotonic clock
+        # so NTP steps or VM resumes can't flip readiness
+        self.last_checked: Optional[float] = None
+        self._last_checked_monotonic: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self):
+        if db.client is None:
+            # Client construction failed at startup (e.g. SRV lookup); try again
+            await connect_to_mongo()
+        started = time.monotonic()
+        try:
+            if db.client is None:
+                raise RuntimeError("Database client is not initialized")
+            await asyncio.wait_for(db.client.admin.command('ping'), timeout=self.timeout)
+            self.connected = True
+            self.error = None
+            self.latency_ms = round((time.monotonic() - started) * 1000, 2)
+        except asyncio.TimeoutError:
+            self.connected = False
+            self.error = f"MongoDB connection timed out ({self.timeout:g}s)"
+            self.latency_ms = None
+        except Exception as e:
+            self.connected = False
+            self.error = str(e)
+            self.latency_ms = None
+        self.last_checked = time.time()
+        self._last_checked_monotonic = time.monotonic()
+        if self.error:
+            logging.warning(f"MongoDB health check failed: {self.error}")
+
+    def is_stale(self) -> bool:
+        if self._last_checked_monotonic is None:
+            return True
+        # Allow a couple of missed intervals before treating the cached result as unreliable
+        return time.monotonic() - self._last_checked_monotonic > self.interval * 3 + self.timeout
+
+    def is_ready(self) -> bool:
+        return self.connected and not self.is_stale()
+
+    def snapshot(self) -> dict:
+        return {
+            "database": "connected" if self.connected else "disconnected",
+            "error": self.error,
+            "latency_ms": self.latency_ms,
+            "last_checked": self.last_checked,
+            "stale": self.is_stale(),
+            "pool": db.pool_monitor.stats(),
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+health_monitor = HealthMonitor(
+    interval=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from typing import List, Optional
+from pymongo.errors import BulkWriteError
+from app.core.config import settings
+from app.services.database import get_database
+
+class HistoryWriter:
+    """Write-behind buffer that groups analysis_history records into insert_many calls.
+
+    Records are flushed when the buffer reaches `batch_size` or every
+    `flush_interval` seconds, whichever comes first. The buffer never grows past
+    `max_buffer`; once full (e.g. during a MongoDB outage) the oldest records are
+    dropped and counted, so the request path never waits on database I/O.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_buffer: int, sync_writes: bool = False):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffer = max(self.batch_size, max_buffer)
+        self.sync_writes = sync_writes
+        self._buffer: List[dict] = []
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.dropped = 0
+
+    async def start(self):
+        if self.sync_writes or self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logging.info("Analysis history writer started")
+
+    async def stop(self):
+        if self._task is not None:
+            # Let the loop finish any in-flight insert_many instead of cancelling it,
+            # otherwise a batch already taken off the buffer would be lost
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        logging.info("Analysis history writer stopped")
+
+    async def add(self, record: dict, sync: bool = False):
+        # Synchronous path for callers that need to read the record back immediately
+        if sync or self.sync_writes or self._task is None:
+            db = await get_database()
+            await db.analysis_history.insert_one(record)
+            return
+
+        if len(self._buffer) >= self.max_buffer:
+            del self._buffer[0]
+            self.dropped += 1
+            logging.warning(f"Analysis history buffer full; dropped oldest record ({self.dropped} dropped so far)")
+
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self):
+        async with self._lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                try:
+                    db = await get_database()
+                    await db.analysis_history.insert_many(batch, ordered=False)
+                except BulkWriteError as e:
+                    # Unordered writes: the rest of the batch was still inserted
+                    logging.error(f"Partial failure writing analysis history: {e.details.get('writeErrors')}")
+                except Exception as e:
+                    logging.error(f"Error writing analysis history batch: {e}")
+                    # Put the batch back (within the memory bound) and retry on the next flush
+                    room = self.max_buffer - len(self._buffer)
+                    if room < len(batch):
+                        self.dropped += len(batch) - room
+                        logging.error(f"Dropping {len(batch) - room} analysis history records: buffer full")
+                    self._buffer[:0] = batch[:max(0, room)]
+                    break
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+history_writer = HistoryWriter(
+    batch_size=settings.HISTORY_BATCH_SIZE,
+    flush_interval=settings.HISTORY_FLUSH_INTERVAL_SECONDS,
+    max_buffer=settings.HISTORY_MAX_BUFFER,
+    sync_writes=settings.HISTORY_SYNC_WRITES,
+)
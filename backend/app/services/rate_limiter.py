@@ -0,0 +1,121 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+from app.core.config import settings
+
+class MemoryTokenBucketStore:
+    """In-process token buckets. Suitable for a single worker and as a stand-in in tests."""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def acquire(self, key: str, capacity: int, refill_per_second: float, cost: int = 1) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        # Evicting the least recently seen client only resets its bucket to full
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def close(self):
+        self._buckets.clear()
+
+# Refill and consume atomically so concurrent workers see a consistent bucket.
+# Redis TIME is used so workers with skewed clocks share one timeline.
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+class RedisTokenBucketStore:
+    """Token buckets shared across workers through Redis."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            import redis.asyncio as redis
+            self._client = redis.from_url(self.url)
+            self._script = self._client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def acquire(self, key: str, capacity: int, refill_per_second: float, cost: int = 1) -> float:
+        try:
+            script = self._get_script()
+            wait = await script(keys=[self.prefix + key], args=[capacity, refill_per_second, cost])
+            return float(wait)
+        except Exception as e:
+            # Fail open: a Redis outage should not take the API down with it
+            logging.error(f"Rate limit store error: {e}")
+            return 0.0
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._script = None
+
+class RateLimiter:
+    def __init__(self, store, budgets: Dict[str, Tuple[int, float]], enabled: bool = True):
+        # budgets maps scope -> (bucket capacity, refill tokens per minute)
+        self.store = store
+        self.budgets = budgets
+        self.enabled = enabled
+
+    async def check(self, scope: str, client_key: str) -> float:
+        """Consume one token and return 0, or the seconds to wait before retrying."""
+        if not self.enabled or scope not in self.budgets:
+            return 0.0
+        capacity, per_minute = self.budgets[scope]
+        if capacity <= 0 or per_minute <= 0:
+            return 0.0
+        return await self.store.acquire(f"{scope}:{client_key}", capacity, per_minute / 60.0)
+
+    async def close(self):
+        await self.store.close()
+
+def create_store():
+    if settings.RATE_LIMIT_STORAGE == "redis":
+        return RedisTokenBucketStore(settings.REDIS_URL)
+    return MemoryTokenBucketStore()
+
+rate_limiter = RateLimiter(
+    store=create_store(),
+    budgets={
+        "llm": (settings.RATE_LIMIT_LLM_CAPACITY, settings.RATE_LIMIT_LLM_PER_MINUTE),
+        "analysis": (settings.RATE_LIMIT_ANALYSIS_CAPACITY, settings.RATE_LIMIT_ANALYSIS_PER_MINUTE),
+    },
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
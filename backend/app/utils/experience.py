@@ -0,0 +1,146 @@
+import re
+from datetime import date
+from typing import Iterable, List, Optional
+
+_NUMBER = r'\d{1,2}|one|two|three|four|five|six|seven|eight|nine|ten'
+_MONTH = r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec'
+_YEAR = r'(?:19|20)\d{2}'
+
+WORD_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+MONTHS = {m: i for i, m in enumerate(_MONTH.split('|'))}
+
+# Nouns that mark an "N years" mention as something other than employment
+_NOT_EXPERIENCE = (
+    r'warranty|guarantee[ds]?|old|ago|later|support|free|subscription|contract|'
+    r'lease|license|plan|anniversary|customers|clients|running|in\s+business'
+)
+# ...or that precede it ("in business for 20 years", "founded 12 years ago")
+_NOT_EXPERIENCE_BEFORE = r'in\s+business|founded|established|serving|trusted|operating'
+
+_WORK_HEADING = r'(?:work|professional|relevant)\s+experience|experience|employment(?:\s+history)?|work\s+history|career\s+history'
+_OTHER_HEADING = (
+    r'education|academics?|certifications?|publications|(?:technical\s+)?skills|projects|awards|'
+    r'volunteer(?:ing)?|interests|references|summary|profile|objective|languages'
+)
+
+# One alternation so a document is scanned exactly once. Branch order matters:
+# at a given position the earlier branch wins. The leading lookahead lists every
+# character a branch can start with, which lets the regex engine skip other
+# positions cheaply; text is lowercased up front instead of using IGNORECASE.
+def _build_pattern(work_section: str, other_section: str):
+    return re.compile(rf'''
+(?=[0-9acdefijlmnoprstvw])\b(?:
+    # "experience of 5 years", "exp 3+ yrs"
+    (?:experience|exp)\s*(?:of\s+)?(?:(?:over|about|more\s+than)\s+)?
+        (?P<pre_num>{_NUMBER})\s*\+?\s*(?:years?|yrs?)\b
+    # "5+ years python", "3-5 years", "4 yoe"; rejected next to a
+    # non-employment word ("2 years warranty", "in business for 20 years")
+  | (?P<deny_before>(?:{_NOT_EXPERIENCE_BEFORE})(?:\s+[^\s\d]+){{0,2}}?\s+)?
+        (?:(?P<range_low>\d{{1,2}})\s*(?:[-–—]|to)\s*)?(?P<num>{_NUMBER})\s*\+?\s*(?:years?|yrs?|yoe)\b
+        (?P<deny>(?:\s+[^\s\d]+){{0,2}}?\s+(?:{_NOT_EXPERIENCE})\b)?
+    # "jan 2018 - present", "2016 to 2019", "20182020" (hyphen stripped by clean_text)
+  | (?:(?P<start_month>{_MONTH})[a-z]*\.?\s*)?(?P<start_year>{_YEAR})
+        \s*(?:[-–—]+|to|until|till)?\s*
+        (?:(?P<end_month>{_MONTH})[a-z]*\.?\s*)?(?P<end_year>{_YEAR}|present|current|now|date|today)\b
+    # Section headings decide whether date ranges count as employment
+  | {work_section}
+  | {other_section}
+)
+''', re.VERBOSE)
+
+# Raw text keeps its line breaks, so a heading must start a line (work headings
+# must also be the whole line). After clean_text everything is one line and a
+# heading is just the word, wherever it appears.
+LINE_PATTERN = _build_pattern(
+    work_section=rf'(?<![^\n])(?P<work_section>{_WORK_HEADING})[ \t]*:?[ \t]*(?=\n|$)',
+    other_section=rf'(?<![^\n])(?P<other_section>{_OTHER_HEADING})\b',
+)
+WORD_PATTERN = _build_pattern(
+    work_section=rf'(?P<work_section>{_WORK_HEADING})\b',
+    other_section=rf'(?P<other_section>{_OTHER_HEADING})\b',
+)
+
+MAX_YEARS = 40 # Sanity check for realistic experience
+
+def _to_int(value: str) -> int:
+    return WORD_NUMBERS[value] if value in WORD_NUMBERS else int(value)
+
+def _claimed_years(match, cleaned: bool) -> int:
+    value = match.group('num')
+    if match.group('range_low'):
+        # "3-5 years": the upper bound is the requirement
+        return _to_int(value)
+    if cleaned and len(value) == 2 and value[0] < value[1] and int(value) >= 20:
+        # clean_text turns "3-5 years" into "35 years"; take the upper bound.
+        # Only guessed for cleaned input, where a real "25 years" is indistinguishable.
+        return int(value[1])
+    return _to_int(value)
+
+def _month_index(year: int, month: Optional[str]) -> int:
+    return year * 12 + (MONTHS[month[:3]] if month else 0)
+
+def _merged_months(spans: List[tuple]) -> int:
+    total = 0
+    current_start, current_end = None, None
+    for start, end in sorted(spans):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+def extract_experience_years(text: str, today: Optional[date] = None, cleaned: bool = False) -> int:
+    """Return years of experience from explicit claims or summed work-history date ranges.
+
+    Explicit "N years" mentions count unless a non-employment noun follows
+    ("warranty", "ago", ...) and take precedence over date ranges. Ranges only
+    count after a work-history heading and before the next other heading;
+    overlapping jobs are merged. Pass raw text where possible: headings are
+    only reliable while line breaks survive, and number ranges keep their
+    hyphen. Set `cleaned` for clean_text output so "35 years" is read as "3-5".
+    """
+    today = today or date.today()
+    now = _month_index(today.year, None) + today.month - 1
+
+    claimed = []
+    spans = []
+    in_work_section = False
+
+    pattern = LINE_PATTERN if "\n" in text else WORD_PATTERN
+    for match in pattern.finditer(text.lower()):
+        if match.group('pre_num'):
+            claimed.append(_to_int(match.group('pre_num')))
+        elif match.group('num'):
+            if not match.group('deny') and not match.group('deny_before'):
+                claimed.append(_claimed_years(match, cleaned))
+        elif match.group('start_year'):
+            if not in_work_section:
+                continue
+            start = _month_index(int(match.group('start_year')), match.group('start_month'))
+            end_year = match.group('end_year')
+            if end_year.isdigit():
+                end = min(now, _month_index(int(end_year), match.group('end_month')))
+            else:
+                end = now
+            if start < end:
+                spans.append((start, end))
+        elif match.group('work_section'):
+            in_work_section = True
+        else:
+            in_work_section = False
+
+    years = [val for val in claimed if 0 < val < MAX_YEARS]
+    if years:
+        return max(years)
+
+    range_years = _merged_months(spans) // 12
+    return range_years if 0 < range_years < MAX_YEARS else 0
+
+def extract_experience_years_batch(texts: Iterable[str], today: Optional[date] = None, cleaned: bool = False) -> List[int]:
+    """Apply extract_experience_years across a batch, sharing the compiled patterns and reference date."""
+    today = today or date.today()
+    return [extract_experience_years(text, today, cleaned) for text in texts]
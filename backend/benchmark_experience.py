@@ -0,0 +1,112 @@
+import re
+import time
+from datetime import date
+from app.utils.experience import extract_experience_years, extract_experience_years_batch
+
+# Reference date for "present" ranges so results are reproducible
+TODAY = date(2026, 1, 1)
+
+# (text, expected years). Every entry is also scored after clean_text, since that
+# is the only shape the analyze and match endpoints pass in.
+RAW_CORPUS = [
+    ("We are looking for a Senior Developer with 5+ years of experience in Python and FastAPI.", 5),
+    ("Junior Frontend role. Requires 1 year of experience with React, Tailwind CSS, and Typescript.", 1),
+    ("Experienced researcher with 8 years of experience. Specialization in NLP.", 8),
+    ("Backend engineer, 6 yoe building distributed systems.", 6),
+    ("Candidates should have at least 3 years in a customer facing role.", 3),
+    ("Minimum of four years professional experience required.", 4),
+    ("Professional summary: experience of 7 years across fintech and healthcare.", 7),
+    ("All laptops come with a 2 years warranty and 3 years of free support.", 0),
+    ("Company founded 12 years ago, serving 10 years of loyal customers.", 0),
+    ("EXPERIENCE\nSoftware Engineer, Acme, 2018 – present\nBuilt APIs.", 8),
+    ("Experience\nData Analyst, Initech, Jan 2015 - Jun 2017\nML Engineer, Globex, Jul 2017 - Dec 2021", 6),
+    ("Work History\nDeveloper, A Corp, 2016 to 2019\nConsultant (part time), B LLC, 2018 to 2020", 4),
+    ("Experience\nEngineer, Foo, 2019 - 2023\nEducation\nB.Sc. Computer Science, 2014 - 2018", 4),
+    ("Education\nM.Sc., State University, 2012 - 2014\nExperience\nAnalyst, Bar Inc, 2014 - 2017", 3),
+    ("experience software engineer acme 20182022 built data pipelines", 4),
+    ("experience senior developer globex 2017 present led a team of 5", 9),
+    ("python developer with 3+ yrs experience in django and flask", 3),
+    ("over 10 years in the industry building web products", 10),
+    ("I have 2 years old twins and enjoy hiking.", 0),
+    ("Skills: Python, React, Docker. Seeking my first role.", 0),
+    # Job description phrasings
+    ("Requirements: 5+ years Python, Docker and AWS.", 5),
+    ("3+ years with React and a passion for UI.", 3),
+    ("Experience: Python developer with 3+ years building APIs.", 3),
+    ("Senior engineer with 10 years building APIs at scale.", 10),
+    ("You bring 5 years of hands-on software development experience.", 5),
+    ("Trusted by clients from 2005 to present. Requires 3 years of experience in Python.", 3),
+    ("Founded in 1999 - 2024 award winner. Looking for a Go developer.", 0),
+    ("Python developer, 2 years of experience. Contact 2021 2022. Award 2015 2024.", 2),
+    ("Requires 2 years of Python.", 2),
+    ("3 years Python", 3),
+    ("6 years in software development", 6),
+    ("Worked 2 years as a data analyst", 2),
+    ("Python developer, 4 years.", 4),
+    ("Sr Dev (2 years) at X", 2),
+    # Known miss after clean_text: indistinguishable from a collapsed "2-5 years"
+    ("25 years of experience leading engineering teams.", 25),
+    ("We have been in business for 20 years. Need 3 years Java.", 3),
+    ("3-5 years of experience with SQL.", 5),
+    ("Looking for 2 to 4 years in backend roles.", 4),
+    # Ranges under non-work headings
+    ("Experience\nEngineer, Foo, 2019 - 2023\nProjects\nHackathon 2010 - 2014", 4),
+    ("Experience\nAnalyst, Bar, 2020 - 2022\nSkills\nPython 2015 - present", 2),
+    ("Experience\nDev, Baz, 2016 - 2020\nVolunteering\nCoach, 2005 - 2015\nAwards\nBest app 2012 - 2013", 4),
+]
+
+def clean_text(text):
+    # Mirrors AIService.clean_text without loading spaCy/scikit-learn
+    text = re.sub(r'[^a-zA-Z0-9\s#+]', '', text)
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+# (text, cleaned, expected)
+CORPUS = [(text, False, expected) for text, expected in RAW_CORPUS] + [
+    (clean_text(text), True, expected) for text, expected in RAW_CORPUS
+]
+
+def legacy_extract_experience_years(text):
+    # Pre-compilation implementation, kept here as the comparison baseline
+    text_lower = text.lower()
+    word_map = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+    for word, digit in word_map.items():
+        text_lower = text_lower.replace(f"{word} year", f"{digit} year")
+
+    patterns = [
+        r'(\d+)\s*\+?\s*years?',
+        r'(\d+)\s*\+?\s*yrs?',
+        r'(\d+)\s*\+?\s*yoe'
+    ]
+    years = []
+    for pattern in patterns:
+        for match in re.findall(pattern, text_lower):
+            val = int(match)
+            if 0 < val < 40:
+                years.append(val)
+    return max(years) if years else 0
+
+def accuracy(name, fn):
+    correct = 0
+    for text, cleaned, expected in CORPUS:
+        result = fn(text, cleaned)
+        if result == expected:
+            correct += 1
+        else:
+            print(f"  {name}: expected {expected}, got {result} for {text[:60]!r}")
+    return correct / len(CORPUS)
+
+def throughput(fn, rounds=2000):
+    texts = [text for text, _, _ in CORPUS] * rounds
+    start = time.perf_counter()
+    fn(texts)
+    elapsed = time.perf_counter() - start
+    return len(texts) / elapsed
+
+if __name__ == "__main__":
+    legacy_acc = accuracy("legacy", lambda text, cleaned: legacy_extract_experience_years(text))
+    new_acc = accuracy("compiled", lambda text, cleaned: extract_experience_years(text, TODAY, cleaned))
+    legacy_rate = throughput(lambda texts: [legacy_extract_experience_years(t) for t in texts])
+    new_rate = throughput(lambda texts: extract_experience_years_batch(texts, TODAY))
+
+    print(f"Accuracy   legacy: {legacy_acc:.0%}  compiled: {new_acc:.0%}")
+    print(f"Throughput legacy: {legacy_rate:,.0f} docs/s  compiled: {new_rate:,.0f} docs/s")